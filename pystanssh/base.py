@@ -2,30 +2,146 @@
 """
 from pathlib import Path
 import getpass
-from os import system
+from os import fspath
+from os.path import getmtime, expanduser
+from functools import lru_cache
 import json
-from io import StringIO
+from io import StringIO, BytesIO
 import gzip
+import tarfile
+import shlex
 from shutil import copyfileobj
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import threading
+import socket
 
-from numpy import ndarray, generic
+from numpy import ndarray, generic, floating, isfinite
 import paramiko
+from paramiko.sftp import CMD_WRITE, int64
+
+from .pool import _POOL
+
+# orjson is optional; it is much faster than the json module for large numeric data:
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+# Preferred SSH ciphers and MACs, tried ahead of paramiko's defaults.  AES-GCM and
+# ChaCha20-Poly1305 are AEAD ciphers using AES-NI/PCLMULQDQ or vectorized code paths,
+# and need no separate MAC pass.  Names the installed paramiko does not support are
+# skipped.
+PREFERRED_CIPHERS = (
+    'aes128-gcm@openssh.com', 'aes256-gcm@openssh.com', 'chacha20-poly1305@openssh.com'
+)
+PREFERRED_MACS = ('hmac-sha2-256-etm@openssh.com', 'hmac-sha2-512-etm@openssh.com')
+
+
+@lru_cache(maxsize=32)
+def _load_key(keypath, mtime):
+    """ Load and cache the RSA key at keypath.  mtime is part of the cache key, so an
+        edited key file is loaded again.
+    Args:
+        keypath (str): Path to RSA key.
+        mtime (float): Modification time of keypath.
+
+    Returns:
+        paramiko.RSAKey: Loaded RSA key.
+    """
+    return paramiko.RSAKey.from_private_key_file(keypath)
+
+
+@lru_cache(maxsize=1)
+def _load_host_keys(known_hosts_path, mtime):
+    """ Load and cache the known hosts file at known_hosts_path.  mtime is part of the
+        cache key, so the file is parsed again only after it changes.
+    Args:
+        known_hosts_path (str): Path to known hosts file.
+        mtime (float): Modification time of known_hosts_path.
+
+    Returns:
+        paramiko.HostKeys: Loaded host keys.  Shared between clients, so treat as
+            read-only.
+    """
+    host_keys = paramiko.HostKeys()
+    host_keys.load(known_hosts_path)
+
+    return host_keys
+
+
+def gather_uploads(conns, items, max_workers=None):
+    """ Upload the same set of files to several hosts concurrently.  Each connection
+        gets its own worker thread, so SSH handshakes and SFTP round-trips to different
+        hosts overlap instead of running one host at a time.
+    Args:
+        conns (List[BaseConnection]): Connection instances, one per host.
+        items (List[Tuple]): (file_path, host_path) pairs passed to upload_file.
+        max_workers (int): Maximum number of worker threads.  Default is None, which
+            uses one thread per connection.
+
+    Returns:
+        List[List[paramiko.sftp_attr.SFTPAttributes]]: Upload outputs for each
+            connection, in the same order as conns.
+    """
+    def _upload_all(conn):
+        return [
+            conn.upload_file(file_path, host_path, close_connection=False)
+            for file_path, host_path in items
+        ]
+
+    if max_workers is None:
+        max_workers = max(len(conns), 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_upload_all, conns))
+
 
 class BaseConnection(object):
     """ Base class for all SSH clients used to move PyStan input/output files
-        between local device and remote host with PyStan installation.
+        between local device and remote host with PyStan installation.  Connections
+        stay open between calls; use the instance as a context manager (or call
+        close_ssh()) to release the connection to the connection pool when done:
+
+            with BaseConnection(host, username, keypath) as conn:
+                conn.upload_file(file_path, host_path)
     Args:
         host (str): Target remote host address name.
         username (str): Username for login.
         keypath (str): Path to RSA key.
+        window_size (int): SSH channel window size in bytes used for SFTP channels.
+            Default is 64 MiB.
+        max_packet_size (int): Maximum SSH channel packet size in bytes used for SFTP
+            channels.  Default is 256 KiB.
+        request_size (int): Bytes per SFTP read/write request.  Must not exceed the
+            server's maximum SFTP message size; OpenSSH accepts up to 255 KiB.
+            Default is 255 KiB.
+        ciphers (Tuple[str]): Cipher names to prefer during key exchange, ahead of
+            paramiko's defaults.  If None, paramiko's order is used.  Default is
+            PREFERRED_CIPHERS.
+        macs (Tuple[str]): MAC names to prefer during key exchange, ahead of paramiko's
+            defaults.  If None, paramiko's order is used.  Default is PREFERRED_MACS.
+        tcp_nodelay (bool): Disable Nagle's algorithm on the SSH socket.  Default is True.
+        socket_buffer_size (int): SO_SNDBUF/SO_RCVBUF size in bytes requested for the SSH
+            socket.  Setting it disables the kernel's TCP buffer autotuning (on Linux the
+            value is also capped at net.core.rmem_max/wmem_max), so leave it as None
+            unless autotuning is known to underperform.  Default is None.
+        keepalive (int): Seconds between SSH keepalive packets.  If 0, no keepalive
+            packets are sent.  Default is 30.
     """
-    def __init__(self, host, username, keypath):
+    def __init__(
+        self, host, username, keypath,
+        window_size=64 * 1024 * 1024, max_packet_size=256 * 1024, request_size=255 * 1024,
+        ciphers=PREFERRED_CIPHERS, macs=PREFERRED_MACS,
+        tcp_nodelay=True, socket_buffer_size=None, keepalive=30
+        ):
         self.host = host
         self.username = username
         # Convert Path instance to string:
-        self.keypath = str(keypath)
+        self.keypath = fspath(keypath)
         try:
-            self.key = paramiko.RSAKey.from_private_key_file(self.keypath)
+            self.key = _load_key(self.keypath, getmtime(self.keypath))
         
         except Exception as e:
             print('Issue loading public key file.')
@@ -33,8 +149,18 @@ class BaseConnection(object):
             self.key = None
         self.stfp_tunnel = None  # stfp connection attribute
         self.client = None # SSH client instance
+        self._channels = []  # Channels opened over self.client's transport
+        self._channels_lock = threading.Lock()
         self.port = 22
         self.timeout = 1000
+        self.window_size = window_size
+        self.max_packet_size = max_packet_size
+        self.request_size = request_size
+        self.ciphers = ciphers
+        self.macs = macs
+        self.tcp_nodelay = tcp_nodelay
+        self.socket_buffer_size = socket_buffer_size
+        self.keepalive = keepalive
 
     def _change_port(self, new_port):
         """ Change default SSH port value 22 to new_port:
@@ -43,6 +169,27 @@ class BaseConnection(object):
         """
         self.port = new_port
     
+    def __enter__(self):
+        """ Enter context manager.  The connection is opened lazily by the first
+            method that needs it.
+        Returns:
+            BaseConnection: This instance.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Exit context manager, releasing the SSH connection to the connection pool
+            if one is still open.  The pool closes it after its idle timeout or at
+            interpreter exit; call close_ssh(pool=False) to disconnect immediately.
+        Args:
+            exc_type (type): Exception type raised in the with block, if any.
+            exc_value (Exception): Exception raised in the with block, if any.
+            traceback (traceback): Traceback of the exception, if any.
+        """
+        # Release the connection if one is still open:
+        if self.client is not None:
+            self.close_ssh()
+
     def _pathtype_check(self, path_obj):
         """ Internal method to check if path_obj is a pathlib.Path instance.
             If it is a string, then path_obj is converted to pathlib.Path type.
@@ -54,6 +201,25 @@ class BaseConnection(object):
         """
         return Utility.pathtype_check(path_obj)
     
+    @staticmethod
+    def _quote_host_path(path_obj):
+        """ Internal method quoting a host path for use in a remote shell command.  A
+            leading '~' is left unquoted so the remote shell still expands it.
+        Args:
+            path_obj (str or pathlib.Path): Host path to quote.
+
+        Returns:
+            str: Shell-quoted host path.
+        """
+        path = fspath(path_obj)
+        if path == '~':
+            return path
+
+        if path.startswith('~/'):
+            return '~/' + shlex.quote(path[2:])
+
+        return shlex.quote(path)
+
     def _convert_arrayitems_to_list(self, array_dict):
         """ Internal method converting copy of input dictionary's array items to
             lists.
@@ -80,16 +246,101 @@ class BaseConnection(object):
         
         return array_dict_copy
 
+    def _pool_key(self):
+        """ Internal method returning the key used for this connection in the
+            module-level SSH connection pool.  Every setting applied when the connection
+            is made is part of the key, so a pooled client is only reused by instances
+            configured the same way.  window_size, max_packet_size and request_size are
+            applied per channel, so they are not part of the key.
+        Returns:
+            Tuple: (host, username, port, keypath, ciphers, macs, tcp_nodelay,
+                socket_buffer_size, keepalive)
+        """
+        return (
+            self.host, self.username, self.port, self.keypath,
+            tuple(self.ciphers or ()), tuple(self.macs or ()),
+            self.tcp_nodelay, self.socket_buffer_size, self.keepalive
+        )
+
+    @staticmethod
+    def _prefer(preferred, available):
+        """ Internal method moving the supported names in preferred to the front of
+            available.
+        Args:
+            preferred (Tuple[str] or None): Algorithm names to try first.
+            available (Tuple[str]): Algorithm names supported by paramiko, in order.
+
+        Returns:
+            Tuple[str]: Reordered algorithm names.
+        """
+        if not preferred:
+            return available
+
+        first = tuple(name for name in preferred if name in available)
+        return first + tuple(name for name in available if name not in first)
+
+    def _tune_socket(self, sock):
+        """ Internal method applying TCP_NODELAY and socket buffer sizes to sock.
+        Args:
+            sock (socket.socket): Connected SSH socket.
+        """
+        if self.tcp_nodelay:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        if self.socket_buffer_size:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_buffer_size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer_size)
+
+    def _transport_factory(self, sock, *args, **kwargs):
+        """ Internal method passed to paramiko.SSHClient.connect as transport_factory,
+            tuning the socket and setting the cipher and MAC preference order before key
+            exchange starts.
+        Args:
+            sock (socket.socket): Connected SSH socket.
+
+        Returns:
+            paramiko.Transport: Transport instance with reordered security options.
+        """
+        # Proxy sockets passed through by paramiko have no socket options to set:
+        if isinstance(sock, socket.socket):
+            self._tune_socket(sock)
+
+        transport = paramiko.Transport(sock, *args, **kwargs)
+        options = transport.get_security_options()
+        options.ciphers = self._prefer(self.ciphers, options.ciphers)
+        options.digests = self._prefer(self.macs, options.digests)
+        transport.set_keepalive(self.keepalive)
+
+        return transport
+
     def connect_ssh(self):
-        """ Connect to host using paramiko.SSHClient()  instance.
+        """ Connect to host using paramiko.SSHClient()  instance.  An idle client from
+            the module-level connection pool is reused if one is available.
         Returns:
             self.client: SSH client instance.
         """
+        # Reuse a pooled client for this host if one is idle:
+        if self.client is None:
+            self.client = _POOL.acquire(self._pool_key())
+            if self.client is not None:
+                return self.client
+
         # Check to see if connection already exists.  If not, create client instance and connect:
         if self.client is None:
             try:
                 self.client = paramiko.SSHClient()
-                self.client.load_system_host_keys()
+
+                # Equivalent to load_system_host_keys(), without re-reading an
+                # unchanged known_hosts file on every connection:
+                known_hosts_path = expanduser('~/.ssh/known_hosts')
+                try:
+                    self.client._system_host_keys = _load_host_keys(
+                        known_hosts_path, getmtime(known_hosts_path)
+                    )
+
+                except FileNotFoundError:
+                    pass
+
                 self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
                 self.client.connect(
                     self.host,
@@ -97,7 +348,8 @@ class BaseConnection(object):
                     username=self.username,
                     key_filename=self.keypath,
                     look_for_keys=True,
-                    timeout=self.timeout
+                    timeout=self.timeout,
+                    transport_factory=self._transport_factory
                 )
 
             except paramiko.AuthenticationException as e:
@@ -112,7 +364,8 @@ class BaseConnection(object):
                             port=self.port,
                             username=self.username,
                             password=getpass.getpass(),
-                            timeout=self.timeout
+                            timeout=self.timeout,
+                            transport_factory=self._transport_factory
                         )
                     
                     except paramiko.AuthenticationException as e2:
@@ -128,6 +381,52 @@ class BaseConnection(object):
 
         return self.client
     
+    def _track_channel(self, channel):
+        """ Internal method recording channel so close_ssh can shut it down, and
+            dropping channels that are already closed.
+        Args:
+            channel (paramiko.Channel): Newly opened channel.
+        """
+        with self._channels_lock:
+            self._channels = [chan for chan in self._channels if not chan.closed]
+            self._channels.append(channel)
+
+    def open_exec_channel(self):
+        """ Open a new session channel over the existing SSH transport, sized like the
+            SFTP channels.  Any number of exec and SFTP channels can be open at once on a
+            single connection.
+        Returns:
+            paramiko.Channel: New session channel instance.
+        """
+        if self.client is None:
+            self.connect_ssh()
+
+        channel = self.client.get_transport().open_session(
+            window_size=self.window_size,
+            max_packet_size=self.max_packet_size
+        )
+        self._track_channel(channel)
+
+        return channel
+
+    def open_sftp_channel(self):
+        """ Open a new SFTP client over the existing SSH transport, on a channel sized
+            for bulk transfers.
+        Returns:
+            paramiko.SFTPClient: New SFTP client instance.
+        """
+        if self.client is None:
+            self.connect_ssh()
+
+        sftp = paramiko.SFTPClient.from_transport(
+            self.client.get_transport(),
+            window_size=self.window_size,
+            max_packet_size=self.max_packet_size
+        )
+        self._track_channel(sftp.get_channel())
+
+        return sftp
+
     def connect_sftp(self, host_path=None):
         """ Open sftp connection to host.
         Args:
@@ -142,7 +441,7 @@ class BaseConnection(object):
             self.connect_ssh()
         
         # Open SFTP tunnel:
-        self.stfp_tunnel = self.client.open_sftp()
+        self.stfp_tunnel = self.open_sftp_channel()
 
         # Change cwd on host to host_dir if given:
         if host_path:
@@ -155,30 +454,127 @@ class BaseConnection(object):
 
         return self.stfp_tunnel
     
-    def send(self, local_path, host_path):
-        """ Send file given by local_path to host_path on host machine using SFTP.
+    def _write_pipelined(self, file_object, host_path, max_inflight=64, sftp=None):
+        """ Internal method writing file_object to host_path with up to max_inflight
+            SFTP WRITE requests outstanding at once, rather than waiting for each
+            request's STATUS reply before sending the next chunk.
+        Args:
+            file_object (file-like object): Binary file object to read and send.
+            host_path (str): Host path to recieve sent file.
+            max_inflight (int): Maximum number of unacknowledged WRITE requests.
+                Default is 64.
+            sftp (paramiko.SFTPClient): SFTP client to write with.  If None,
+                self.stfp_tunnel is used.  Default is None.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        if sftp is None:
+            sftp = self.stfp_tunnel
+
+        inflight = deque()
+        offset = 0
+        with sftp.open(host_path, 'wb') as f:
+            while True:
+                data = file_object.read(self.request_size)
+                if not data:
+                    break
+
+                # StringIO objects give str data, which may grow when encoded:
+                if type(data) is str:
+                    data = data.encode('utf-8')
+
+                for start in range(0, len(data), self.request_size):
+                    chunk = data[start:start + self.request_size]
+                    inflight.append(
+                        sftp._async_request(
+                            type(None), CMD_WRITE, f.handle, int64(offset), chunk
+                        )
+                    )
+                    offset += len(chunk)
+
+                    # Wait on the oldest request once the window is full:
+                    if len(inflight) >= max_inflight:
+                        sftp._read_response(inflight.popleft())
+
+            # Drain remaining acknowledgements:
+            while inflight:
+                sftp._read_response(inflight.popleft())
+
+        return offset
+
+    def _confirm_send(self, host_path, size, verify, sftp=None):
+        """ Internal method optionally checking that a sent file arrived in full.  The
+            check costs an extra SFTP STAT round trip, so it is skipped unless verify
+            is True.
+        Args:
+            host_path (str): Host path of sent file.
+            size (int): Number of bytes sent.
+            verify (bool): If True, stat host_path and compare its size to size.
+            sftp (paramiko.SFTPClient): SFTP client to stat with.  If None,
+                self.stfp_tunnel is used.  Default is None.
+
+        Returns:
+            paramiko.sftp_attr.SFTPAttributes: Sent file attribute instance, empty if
+                verify is False.
+        """
+        if not verify:
+            return paramiko.SFTPAttributes()
+
+        if sftp is None:
+            sftp = self.stfp_tunnel
+
+        send_output = sftp.stat(host_path)
+        if send_output.st_size != size:
+            raise IOError(f'size mismatch in put!  {send_output.st_size} != {size}')
+
+        return send_output
+
+    def send_pipelined(self, local_path, host_path, max_inflight=64, verify=False):
+        """ Send file given by local_path to host_path on host machine using SFTP,
+            keeping up to max_inflight WRITE requests on the wire at once.
         Args:
             local_path (str or pathlib.Path): Local file path to send up to host.
             host_path (str or pathlib.Path): Host path to recieve sent file.
-        
+            max_inflight (int): Maximum number of unacknowledged WRITE requests.
+                Default is 64.
+            verify (bool): If True, stat the sent file to confirm its size.  Default
+                is False.
+
         Returns:
             paramiko.sftp_attr.SFTPAttributes: Sent file attribute instance.
-
         """
         # Open SFTP tunnel if not already open
         if self.stfp_tunnel is None:
             self.connect_sftp()
 
-        # Send file:
-        send_output = self.stfp_tunnel.put(str(local_path), str(host_path))
+        host_path = fspath(host_path)
+        with open(fspath(local_path), 'rb') as f:
+            size = self._write_pipelined(f, host_path, max_inflight=max_inflight)
 
-        return send_output
+        return self._confirm_send(host_path, size, verify)
+
+    def send(self, local_path, host_path, verify=False):
+        """ Send file given by local_path to host_path on host machine using SFTP.
+        Args:
+            local_path (str or pathlib.Path): Local file path to send up to host.
+            host_path (str or pathlib.Path): Host path to recieve sent file.
+            verify (bool): If True, stat the sent file to confirm its size.  Default
+                is False.
+        
+        Returns:
+            paramiko.sftp_attr.SFTPAttributes: Sent file attribute instance.
+
+        """
+        return self.send_pipelined(local_path, host_path, verify=verify)
     
-    def send_fileobject(self, file_object, host_path):
+    def send_fileobject(self, file_object, host_path, verify=False):
         """ Send file object to host_path on host machine using SFTP:
         Args:
             file_object (file-like object): File object to send up to host.
             host_path (str or pathlib.Path): Host path to recieve sent file.
+            verify (bool): If True, stat the sent file to confirm its size.  Default
+                is False.
         
         Returns:
             paramiko.sftp_attr.SFTPAttributes: Sent file attribute instance.
@@ -188,9 +584,174 @@ class BaseConnection(object):
             self.connect_sftp()
         
         # Send file:
-        send_output = self.stfp_tunnel.putfo(file_object, str(host_path))
+        host_path = fspath(host_path)
+        size = self._write_pipelined(file_object, host_path)
 
-        return send_output
+        return self._confirm_send(host_path, size, verify)
+
+    @staticmethod
+    def _has_nonfinite(obj):
+        """ Internal method checking obj for NaN or +/-Infinity floats, searching nested
+            dicts, lists, tuples and numpy arrays.
+        Args:
+            obj (object): Object to check.
+
+        Returns:
+            bool: True if obj contains a non-finite float.
+        """
+        if isinstance(obj, dict):
+            return any(BaseConnection._has_nonfinite(value) for value in obj.values())
+
+        if isinstance(obj, (list, tuple)):
+            return any(BaseConnection._has_nonfinite(value) for value in obj)
+
+        if isinstance(obj, (float, floating)):
+            return not isfinite(obj)
+
+        if isinstance(obj, ndarray) and obj.dtype.kind in 'fc':
+            return not isfinite(obj).all()
+
+        return False
+
+    @staticmethod
+    def _json_default(obj):
+        """ Internal 'default' hook letting the json module encode numpy arrays and
+            scalars.
+        Args:
+            obj (object): Object the json module can't encode.
+
+        Returns:
+            object: Python list or scalar equivalent of obj.
+        """
+        if isinstance(obj, ndarray):
+            return obj.tolist()
+
+        if isinstance(obj, generic):
+            return obj.item()
+
+        raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+    @staticmethod
+    def _orjson_dumps(dictobj):
+        """ Internal method encoding dictobj with orjson when it gives the same data as
+            the json module.  orjson writes NaN and +/-Infinity as null and rejects
+            integers wider than 64 bits, so those cases are left to the json module.
+        Args:
+            dictobj (Dict): Dictionary-like object that can be converted to JSON.
+
+        Returns:
+            bytes or None: orjson encoding of dictobj, or None if orjson is not
+                installed, dictobj contains non-finite floats, or orjson can't encode it.
+        """
+        if orjson is None or BaseConnection._has_nonfinite(dictobj):
+            return None
+
+        try:
+            return orjson.dumps(
+                dictobj,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+
+        except orjson.JSONEncodeError:
+            return None
+
+    def save_json(self, dictobj, path):
+        """ Save dictobj as a local JSON file, encoded exactly as send_json would
+            upload it.
+        Args:
+            dictobj (Dict): Dictionary-like object that can be converted to JSON.
+            path (str or pathlib.Path): Local JSON file path.
+        """
+        data_dumps = self._orjson_dumps(dictobj)
+        with open(fspath(path), 'wb') as f:
+            if data_dumps is not None:
+                f.write(data_dumps)
+
+            else:
+                encoder = json.JSONEncoder(indent=4, default=self._json_default)
+                for chunk in encoder.iterencode(dictobj):
+                    f.write(chunk.encode('utf-8'))
+
+    def send_json(self, dictobj, host_path, verify=False):
+        """ Encode dictobj as JSON directly into host_path on host machine using SFTP.
+            If orjson is installed and can encode dictobj exactly (no non-finite floats
+            or integers wider than 64 bits), it encodes it in one pass.  Otherwise, json
+            module chunks are written to a pipelined remote file as they are produced,
+            so no full JSON string dump is built in memory.  Numpy arrays and scalars
+            are supported either way.
+        Args:
+            dictobj (Dict): Dictionary-like object that can be converted to JSON.
+            host_path (str or pathlib.Path): Host path to recieve JSON file.
+            verify (bool): If True, stat the sent file to confirm its size.  Default
+                is False.
+
+        Returns:
+            paramiko.sftp_attr.SFTPAttributes: Sent file attribute instance.
+        """
+        # Open SFTP tunnel if not already open
+        if self.stfp_tunnel is None:
+            self.connect_sftp()
+
+        host_path = fspath(host_path)
+        data_dumps = self._orjson_dumps(dictobj)
+        if data_dumps is not None:
+            size = self._write_pipelined(BytesIO(data_dumps), host_path)
+
+            return self._confirm_send(host_path, size, verify)
+
+        try:
+            with self.stfp_tunnel.open(host_path, 'wb', bufsize=self.request_size) as f:
+                f.MAX_REQUEST_SIZE = self.request_size
+                f.set_pipelined(True)
+                encoder = json.JSONEncoder(indent=4, default=self._json_default)
+                for chunk in encoder.iterencode(dictobj):
+                    f.write(chunk.encode('utf-8'))
+
+                f.flush()
+                size = f.tell()
+
+        # Don't leave a truncated JSON file on host:
+        except TypeError:
+            self.stfp_tunnel.remove(host_path)
+            raise
+
+        return self._confirm_send(host_path, size, verify)
+
+    def _read_pipelined(self, host_path, file_object, max_inflight=64, sftp=None):
+        """ Internal method copying host_path into file_object with up to max_inflight
+            SFTP READ requests outstanding at once.  Paramiko's prefetch reassembles the
+            out-of-order replies by offset before they are read back in sequence.
+        Args:
+            host_path (str): Host path of file to grab.
+            file_object (file-like object): Binary file object to write grabbed data to.
+            max_inflight (int): Maximum number of unanswered READ requests.
+                Default is 64.
+            sftp (paramiko.SFTPClient): SFTP client to read with.  If None,
+                self.stfp_tunnel is used.  Default is None.
+
+        Returns:
+            paramiko.sftp_attr.SFTPAttributes: Grabbed file attribute instance.
+        """
+        if sftp is None:
+            sftp = self.stfp_tunnel
+
+        with sftp.open(host_path, 'rb') as f:
+            f.MAX_REQUEST_SIZE = self.request_size
+            get_output = f.stat()
+            f.prefetch(get_output.st_size, max_concurrent_requests=max_inflight)
+            size = 0
+            while True:
+                data = f.read(self.request_size)
+                if not data:
+                    break
+
+                file_object.write(data)
+                size += len(data)
+
+        if size != get_output.st_size:
+            raise IOError(f'size mismatch in get!  {size} != {get_output.st_size}')
+
+        return get_output
 
     def get(self, host_path, local_path):
         """ Get file from remote machine from host_path on local machine local_path using SFTP.
@@ -206,27 +767,31 @@ class BaseConnection(object):
         if self.stfp_tunnel is None:
             self.connect_sftp()
 
-        # Send file:
-        get_output = self.stfp_tunnel.get(str(host_path), str(local_path))
+        # Grab file:
+        with open(fspath(local_path), 'wb') as f:
+            get_output = self._read_pipelined(fspath(host_path), f)
 
         return get_output
 
     def get_fileobject(self, host_path):
-        """ Get file from host_path on host machine using SFTP and return file object:
+        """ Get file from host_path on host machine using SFTP and return it as an
+            in-memory file object, without writing a local file.
         Args:
-            host_path (str or pathlib.Path): Host path to recieve sent file.
+            host_path (str or pathlib.Path): Host path of file to grab.
         
         Returns:
-            paramiko.sftp_attr.SFTPAttributes: Grabbed file attribute instance.
+            io.BytesIO: Grabbed file contents, positioned at the start.
         """
         # Open SFTP tunnel if not already open
         if self.stfp_tunnel is None:
             self.connect_sftp()
         
-        # Send file:
-        get_output = self.stfp_tunnel.getfo(str(host_path), file_object)
+        # Grab file:
+        file_object = BytesIO()
+        self._read_pipelined(fspath(host_path), file_object)
+        file_object.seek(0)
 
-        return get_output
+        return file_object
     
     def close_sftp(self):
         """ Closes SFTP tunnel instance if open.
@@ -242,8 +807,15 @@ class BaseConnection(object):
         
         return True
     
-    def close_ssh(self):
-        """ Closes SSH Client if open.
+    def close_ssh(self, pool=True):
+        """ Releases SSH Client back to the module-level connection pool if open.  The
+            pool closes the underlying connection once it is dead, idle for too long, or
+            the pool for this host is full.  Pooled connections are closed when the
+            interpreter exits.
+        Args:
+            pool (bool): If False, the SSH connection is closed instead of being
+                returned to the pool.  Default is True.
+
         Returns:
             Bool: True is successful.
         """
@@ -251,22 +823,33 @@ class BaseConnection(object):
             print('No SSH client connected.')
         
         else:
-            # Close SFTP tunnel first:
+            # Close SFTP tunnel and any other open channels first:
             if self.stfp_tunnel:
                 self.close_sftp()
+
+            with self._channels_lock:
+                for channel in self._channels:
+                    channel.close()
+
+                self._channels = []
             
-            self.client.close()
+            if pool:
+                _POOL.release(self._pool_key(), self.client)
+
+            else:
+                self.client.close()
+
             self.client = None
         
         return True
 
-    def upload_serialobj(self, obj, host_path, fname, close_connection=True):
+    def upload_serialobj(self, obj, host_path, fname, close_connection=False):
         """ Uploads file-like serialized object converted to StringIO object to host_path.
         Args:
             obj (Dict): File-like serialized object to send to host path.
             host_path (str or pathlib.Path): Path on host to send and save obj.
             fname (str): File name for file saved on host machine.
-            close_connection (bool): Close connection once complete.  Default is True.
+            close_connection (bool): Close connection once complete.  Default is False.
         
         Returns:
             paramiko.sftp_attr.SFTPAttributes
@@ -294,13 +877,13 @@ class BaseConnection(object):
     
         return send_output
 
-    def upload_jsonobj(self, dictobj, host_path, fname, close_connection=True):
+    def upload_jsonobj(self, dictobj, host_path, fname, close_connection=False):
         """ Upload dictionary-like object to host with path host_path / fname. 
         Args:
             dictobj (Dict): Dictionary-like object that can be converted to JSON string dump.
             host_path (str or pathlib.Path): Path on host to send data.
             fname (str): File name for file saved on host machine.  Will always be a json file.
-            close_connection (bool): Close connection once complete.  Default is True.
+            close_connection (bool): Close connection once complete.  Default is False.
         
         Returns:
             paramiko.sftp_attr.SFTPAttributes
@@ -311,9 +894,11 @@ class BaseConnection(object):
         
         host_json_path = host_path / fname_json
 
-        # Make JSON string dump and send to host path:
+        # Stream JSON encoding straight to host path:
         try:
-            dict_dumps = json.dumps(dictobj, indent=4)
+            print(f'Uploading file {fname_json} to {self.host}...')
+            send_output = self.send_json(dictobj, host_json_path)
+            print('Done.')
         
         # Let user know they have nonserializable data types (probably from numpy) in 
         # dictionaries:
@@ -321,17 +906,25 @@ class BaseConnection(object):
             print('Check non-array/non-list data types in input or init dictionaries!')
             print('All data types must be native python types.')
             raise(e)
-    
-        return self.upload_serialobj(
-            dict_dumps, host_json_path, fname_json, close_connection=close_connection
-            )
 
-    def upload_file(self, file_path, host_path, close_connection=True):
+        # Handle other errors with printed message, returning None instead.
+        except Exception as e:
+            print(f'Error occured uploading {fname_json}.')
+            print(e)
+            send_output = None
+
+        # Close connection:
+        if close_connection:
+            self.close_ssh()
+
+        return send_output
+
+    def upload_file(self, file_path, host_path, close_connection=False):
         """ Upload file to host server location host_path.
         Args:
             file_path (str or pathlib.Path): Local file location.
             host_path (str or pathlib.Path): Host location to copy file to.
-            close_connection (bool): Close connection once complete.  Default is True.
+            close_connection (bool): Close connection once complete.  Default is False.
         
         Returns:
             paramiko.sftp_attr.SFTPAttributes
@@ -366,12 +959,12 @@ class BaseConnection(object):
 
         return send_output
 
-    def download_file(self, host_path, file_path, close_connection=True, compress=True):
+    def download_file(self, host_path, file_path, close_connection=False, compress=True):
         """ Upload file to host server location host_path.
         Args:
             host_path (str or pathlib.Path): Host location to copy file to.
             file_path (str or pathlib.Path): Local file location.
-            close_connection (bool): Close connection once complete.  Default is True.
+            close_connection (bool): Close connection once complete.  Default is False.
             compress (bool): If True, then the file is downloaded and then compressed.
                 Default is True.
         
@@ -411,26 +1004,238 @@ class BaseConnection(object):
 
         return get_output
     
-    def run_command(self, cmd, cmd_path):
-        """ Wrapper for 'exec_command' method to run a single command on a ssh
-            terminal at the given path.
+    def _map_sftp(self, func, items, max_workers):
+        """ Internal method applying func(sftp, item) to each item on a thread pool.
+            Each worker thread opens its own SFTP client over the shared SSH transport,
+            so transfers run on concurrent channels of a single connection.
         Args:
-            cmd (str): Command to execute on remote terminal.
-            cmd_path (str or pathlib.Path): Path to execute command.
+            func (Callable): Function taking an SFTP client and an item.
+            items (List): Items to process.
+            max_workers (int): Maximum number of worker threads.
+
+        Returns:
+            List: Outputs of func, in the same order as items.
         """
         if self.client is None:
             self.connect_ssh()
-        
+
+        local = threading.local()
+        clients = []
+        clients_lock = threading.Lock()
+
+        def _worker(item):
+            # Open one SFTP client per worker thread and reuse it for later items:
+            if not hasattr(local, 'sftp'):
+                local.sftp = self.open_sftp_channel()
+                with clients_lock:
+                    clients.append(local.sftp)
+
+            return func(local.sftp, item)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_worker, items))
+
+        finally:
+            for sftp in clients:
+                sftp.close()
+
+    def upload_files(self, pairs, max_workers=8, close_connection=False, verify=False):
+        """ Upload several files to host server concurrently over one SSH connection.
+        Args:
+            pairs (List[Tuple]): (file_path, host_path) pairs.  As with upload_file, if
+                host_path has no suffix, then the local file name is appended to it.
+            max_workers (int): Maximum number of concurrent SFTP channels.  Default is 8.
+            close_connection (bool): Close connection once complete.  Default is False.
+            verify (bool): If True, stat each sent file to confirm its size.  Default
+                is False.
+
+        Returns:
+            List[paramiko.sftp_attr.SFTPAttributes]: Sent file attributes for each pair.
+        """
+        def _upload(sftp, pair):
+            file_path = self._pathtype_check(pair[0])
+            host_path = self._pathtype_check(pair[1])
+            if not host_path.suffix:
+                host_path = host_path / file_path.name
+
+            host_path = fspath(host_path)
+            with open(fspath(file_path), 'rb') as f:
+                size = self._write_pipelined(f, host_path, sftp=sftp)
+
+            return self._confirm_send(host_path, size, verify, sftp=sftp)
+
+        print(f'Uploading {len(pairs)} files to {self.host}...')
+        send_output = self._map_sftp(_upload, pairs, max_workers)
+        print('Done.')
+
+        # Close connection:
+        if close_connection:
+            self.close_ssh()
+
+        return send_output
+
+    def upload_files_tar(self, file_paths, host_path, close_connection=False):
+        """ Upload several files to host directory host_path as a single tar stream,
+            unpacked on host by 'tar -xf -'.  This avoids the per-file SFTP open/close
+            round trips, which dominate when uploading many small files.
+        Args:
+            file_paths (List[str or pathlib.Path]): Local file locations.  Files are
+                unpacked on host under their local file names.
+            host_path (str or pathlib.Path): Existing host directory to unpack files in.
+            close_connection (bool): Close connection once complete.  Default is False.
+
+        Returns:
+            List[pathlib.Path]: Host paths of uploaded files.
+        """
+        host_path = self._pathtype_check(host_path)
+        file_paths = [self._pathtype_check(file_path) for file_path in file_paths]
+
+        print(f'Uploading {len(file_paths)} files to {self.host}...')
+        channel = self.open_exec_channel()
+        try:
+            channel.exec_command(f'tar -xf - -C {self._quote_host_path(host_path)}')
+
+            # Stream the archive straight into tar's stdin.  If tar exits early, the
+            # write fails with a closed channel, so report tar's own error below:
+            # tarfile buffers its own records, so stdin is left unbuffered.
+            stream_error = None
+            try:
+                with channel.makefile('wb', 0) as stdin:
+                    with tarfile.open(fileobj=stdin, mode='w|') as tar:
+                        for file_path in file_paths:
+                            tar.add(fspath(file_path), arcname=file_path.name)
+
+            except (OSError, EOFError) as e:
+                # Local errors (e.g. a missing file) are raised as they are:
+                if not (channel.closed or channel.exit_status_ready()):
+                    raise
+
+                stream_error = e
+
+            channel.shutdown_write()
+            exit_status = channel.recv_exit_status()
+            if exit_status:
+                error = str(channel.makefile_stderr('rb').read(), encoding='utf-8')
+                raise IOError(
+                    f'Remote tar exited with status {exit_status}: {error}'
+                ) from stream_error
+
+            if stream_error is not None:
+                raise stream_error
+
+            print('Done.')
+
+        finally:
+            channel.close()
+
+        # Close connection:
+        if close_connection:
+            self.close_ssh()
+
+        return [host_path / file_path.name for file_path in file_paths]
+
+    def download_files(self, pairs, max_workers=8, close_connection=False, compress=True):
+        """ Download several files from host server concurrently over one SSH connection.
+        Args:
+            pairs (List[Tuple]): (host_path, file_path) pairs.  As with download_file, if
+                file_path has no suffix, then the host file name is appended to it.
+            max_workers (int): Maximum number of concurrent SFTP channels.  Default is 8.
+            close_connection (bool): Close connection once complete.  Default is False.
+            compress (bool): If True, then each file is downloaded and then compressed.
+                Default is True.
+
+        Returns:
+            List[paramiko.sftp_attr.SFTPAttributes]: Grabbed file attributes for each pair.
+        """
+        def _download(sftp, pair):
+            host_path = self._pathtype_check(pair[0])
+            file_path = self._pathtype_check(pair[1])
+            if not file_path.suffix:
+                file_path = file_path / host_path.name
+
+            with open(fspath(file_path), 'wb') as f:
+                get_output = self._read_pipelined(fspath(host_path), f, sftp=sftp)
+
+            if compress:
+                Utility.compress_file(file_path)
+
+            return get_output
+
+        print(f'Downloading {len(pairs)} files from {self.host}...')
+        get_output = self._map_sftp(_download, pairs, max_workers)
+        print('Done.')
+
+        # Close connection:
+        if close_connection:
+            self.close_ssh()
+
+        return get_output
+
+    def _run_at(self, cmds, cmd_path, check=False):
+        """ Internal method running commands chained with '&&' at cmd_path on a single
+            exec channel.  Each command is wrapped in a '{ ...; }' group, so ';', '||' or
+            '&' inside one command can't run past a failed cd or earlier command.
+        Args:
+            cmds (List[str]): Commands to execute on remote terminal, in order.
+            cmd_path (str or pathlib.Path): Path to execute commands.
+            check (bool): Raise IOError if the commands exit with a nonzero status.
+                Default is False.
+
+        Returns:
+            str: Combined standard output of the commands.
+        """
+        cmd = ' && '.join(cmds)
+        groups = ' && '.join(f'{{ {group_cmd}\n}}' for group_cmd in cmds)
+        channel = self.open_exec_channel()
         try:
             print(f'Running command \'{cmd}\'...')
-            full_command = f'cd {str(cmd_path)};{cmd}'
-            exec_out = self.client.exec_command(full_command)
+            full_command = f'cd {self._quote_host_path(cmd_path)} && {groups}'
+            channel.exec_command(full_command)
+            exec_out = channel.makefile('rb').read()
+            exit_status = channel.recv_exit_status()
+            if check and exit_status:
+                error = str(channel.makefile_stderr('rb').read(), encoding='utf-8')
+                raise IOError(f'Command \'{cmd}\' exited with status {exit_status}: {error}')
+
             print('Done.')
-        
-        except:
-            raise
 
-        return str(exec_out[1].read(), encoding='utf-8')
+        finally:
+            channel.close()
+
+        return str(exec_out, encoding='utf-8')
+
+    def run_command(self, cmd, cmd_path, check=False):
+        """ Wrapper for 'exec_command' method to run a single command on a ssh
+            terminal at the given path.
+            Runs on its own channel, so it can overlap SFTP transfers on the same
+            connection.
+        Args:
+            cmd (str): Command to execute on remote terminal.
+            cmd_path (str or pathlib.Path): Path to execute command.
+            check (bool): Raise IOError with the remote standard error if the command
+                (or changing to cmd_path) exits with a nonzero status.  Default is False.
+
+        Returns:
+            str: Standard output of the command.
+        """
+        return self._run_at([cmd], cmd_path, check=check)
+
+    def run_batch(self, cmds, cmd_path, check=False):
+        """ Run several commands on a ssh terminal at the given path using a single
+            'exec_command' call.  Commands are chained with '&&', so they share one SSH
+            channel and stop at the first failing command.  Each command runs as its own
+            group, so this holds even for commands that contain ';', '||' or '&'.
+        Args:
+            cmds (List[str]): Commands to execute on remote terminal, in order.
+            cmd_path (str or pathlib.Path): Path to execute commands.
+            check (bool): Raise IOError with the remote standard error if a command (or
+                changing to cmd_path) exits with a nonzero status.  Default is False.
+
+        Returns:
+            str: Combined standard output of the commands.
+        """
+        return self._run_at(cmds, cmd_path, check=check)
 
 
 class KeyUploader(object):
@@ -447,7 +1252,7 @@ class KeyUploader(object):
         """
         try:
             # Snag RSA key from path given:
-            rsa_key = paramiko.RSAkey.from_private_key_file(keypath)
+            rsa_key = paramiko.RSAKey.from_private_key_file(keypath)
         
         except paramiko.SSHException as e:
             print(f'Check given path {keypath}.')
@@ -456,23 +1261,71 @@ class KeyUploader(object):
         return rsa_key
     
     @staticmethod
-    def upload_private_key(keypath, host, username):
-        """ Upload private RSA key located at keypath to given host for user username.
+    def upload_private_key(keypath, host, username, port=22):
+        """ Upload the public half of the RSA key located at keypath to given host for
+            user username, appending it to ~/.ssh/authorized_keys over SFTP.  The public
+            key is read from <keypath>.pub, or derived from the private key if that file
+            does not exist.  Other available keys are tried first, then a password.
         Args:
-            keypath (str): Local location of private key file.
+            keypath (str or pathlib.Path): Local location of private key file.
             host (str): Host name.
             username (str): Username
+            port (int): SSH port on host.  Default is 22.
         """
+        keypath = expanduser(fspath(keypath))
         try:
-            system(f'ssh-copy-id -i {keypath} {user}@{host}>/dev/null 2>&1')
-            system(f'ssh-copy-id -i {keypath}.pub {user}@{host}>/dev/null 2>&1')
-        
-        except FileNotFoundError as e:
-            print(f'Check given path {keypath}.')
-            raise e
-        
-        except:
-            raise
+            with open(f'{keypath}.pub') as f:
+                public_key = f.read().strip()
+
+        except FileNotFoundError:
+            rsa_key = KeyUploader.get_private_key(keypath)
+            public_key = f'{rsa_key.get_name()} {rsa_key.get_base64()}'
+
+        with paramiko.SSHClient() as client:
+            client.load_system_host_keys()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            try:
+                client.connect(host, port=port, username=username)
+
+            # Fall back to a password only if no key or agent identity is accepted:
+            except paramiko.SSHException as e:
+                no_auth_methods = str(e) == 'No authentication methods available'
+                if not (isinstance(e, paramiko.AuthenticationException) or no_auth_methods):
+                    raise
+
+                print(f'Check your SSH key for host {host}, username {username}.')
+                try_password = input('Try password?  [y/n]: ')
+
+                if try_password == 'y':
+                    client.connect(
+                        host, port=port, username=username, password=getpass.getpass(),
+                        look_for_keys=False, allow_agent=False
+                    )
+
+                # Else, raise authentication exception:
+                else:
+                    print('Connection failed.')
+                    raise
+
+            with client.open_sftp() as sftp:
+                # Make sure ~/.ssh exists with the permissions sshd expects:
+                try:
+                    sftp.stat('.ssh')
+
+                except FileNotFoundError:
+                    sftp.mkdir('.ssh', mode=0o700)
+
+                # Append the key unless it is already authorized:
+                with sftp.open('.ssh/authorized_keys', 'a+') as f:
+                    f.seek(0)
+                    authorized = f.read().decode('utf-8')
+                    if public_key not in authorized.splitlines():
+                        if authorized and not authorized.endswith('\n'):
+                            f.write('\n')
+
+                        f.write(f'{public_key}\n')
+
+                sftp.chmod('.ssh/authorized_keys', 0o600)
 
 class Utility(object):
     """ Container class for misc functionality
@@ -0,0 +1,158 @@
+""" Process-wide pool of open SSH clients so repeated connections to the same host
+    reuse an established transport instead of redoing the TCP/KEX/auth handshake.
+"""
+from collections import deque
+import atexit
+import os
+import threading
+import time
+
+
+class SSHConnectionPool(object):
+    """ Thread-safe pool of idle paramiko.SSHClient instances keyed by connection
+        settings, e.g. (host, username, port, keypath, ...).
+    Args:
+        max_connections (int): Maximum number of idle clients kept per key.  Extra
+            clients released to the pool are closed.  Default is 4.
+        idle_timeout (float): Seconds an idle client may sit in the pool before it is
+            evicted and closed.  A background timer runs while clients are idle, so
+            eviction does not wait for the next acquire or release.  Default is 300.
+    """
+    def __init__(self, max_connections=4, idle_timeout=300):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._evictor = None  # Pending eviction timer
+
+    @staticmethod
+    def _is_alive(client):
+        """ Internal method checking that client's transport is still usable.
+        Args:
+            client (paramiko.SSHClient): Client to check.
+
+        Returns:
+            bool: True if the transport is active and accepts an SSH_MSG_IGNORE packet.
+        """
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+
+        try:
+            transport.send_ignore()
+
+        except Exception:
+            return False
+
+        return True
+
+    def _evict_expired(self):
+        """ Internal method closing clients idle for longer than idle_timeout.  Must be
+            called with self._lock held.
+        """
+        now = time.monotonic()
+        for key in list(self._idle):
+            idle = self._idle[key]
+            while idle and now - idle[0][1] > self.idle_timeout:
+                client, _ = idle.popleft()
+                client.close()
+
+            if not idle:
+                del self._idle[key]
+
+    def _schedule_eviction(self):
+        """ Internal method starting a timer that fires when the oldest idle client
+            expires, if one is not already pending.  Must be called with self._lock held.
+        """
+        if self._evictor is not None or not self._idle:
+            return
+
+        oldest = min(idle[0][1] for idle in self._idle.values())
+        delay = max(oldest + self.idle_timeout - time.monotonic(), 0)
+        self._evictor = threading.Timer(delay, self._run_eviction)
+        self._evictor.daemon = True
+        self._evictor.start()
+
+    def _run_eviction(self):
+        """ Internal timer callback closing expired clients and rescheduling itself
+            while any clients remain idle.
+        """
+        with self._lock:
+            self._evictor = None
+            self._evict_expired()
+            self._schedule_eviction()
+
+    def acquire(self, key):
+        """ Borrow an idle client for key.
+        Args:
+            key (Tuple): (host, username, port, keypath) connection key.
+
+        Returns:
+            paramiko.SSHClient or None: Live pooled client, or None if none are idle.
+        """
+        with self._lock:
+            self._evict_expired()
+            idle = self._idle.get(key)
+            while idle:
+                client, _ = idle.pop()
+                if self._is_alive(client):
+                    return client
+
+                client.close()
+
+        return None
+
+    def release(self, key, client):
+        """ Return client to the pool for reuse.  Dead clients and clients beyond
+            max_connections are closed instead.
+        Args:
+            key (Tuple): (host, username, port, keypath) connection key.
+            client (paramiko.SSHClient): Client to return.
+        """
+        if not self._is_alive(client):
+            client.close()
+            return
+
+        with self._lock:
+            self._evict_expired()
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_connections:
+                idle.append((client, time.monotonic()))
+                self._schedule_eviction()
+                return
+
+        client.close()
+
+    def clear(self):
+        """ Close and drop every pooled client.
+        """
+        with self._lock:
+            if self._evictor is not None:
+                self._evictor.cancel()
+                self._evictor = None
+
+            for idle in self._idle.values():
+                for client, _ in idle:
+                    client.close()
+
+            self._idle.clear()
+
+    def _reset_after_fork(self):
+        """ Internal method dropping every pooled client without closing it.  Used in
+            forked child processes, where the clients' sockets and transport state still
+            belong to the parent process.
+        """
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._evictor = None
+
+
+# Module-level pool shared by all connections in this process:
+_POOL = SSHConnectionPool()
+
+# Disconnect idle clients on interpreter exit:
+atexit.register(_POOL.clear)
+
+# Never hand a parent's client to a forked child (e.g. multiprocessing workers):
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_POOL._reset_after_fork)
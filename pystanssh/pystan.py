@@ -1,13 +1,14 @@
 """ Legacy PyStan2 ssh functionality.
 """
-import json
 from io import StringIO
 
 from .base import BaseConnection
 
 
 class PyStanSSH(BaseConnection):
-    """ PyStan SSH connector class.  Each method opens, then closes, SSH/SFTP connection.
+    """ PyStan SSH connector class.  Each method opens the SSH/SFTP connection if needed
+        and leaves it open for later calls; use as a context manager to release it
+        to the connection pool.
     """
     def __init__(self, host, username, keypath):
         super().__init__(host, username, keypath)
@@ -15,7 +16,7 @@ class PyStanSSH(BaseConnection):
     def upload_sampling_input(
         self, input_data, num_samples, num_chains, host_path, fname,
         stan_code=None, stan_code_path=None,
-        init=None, close_connection=True, save_json_path=None
+        init=None, close_connection=False, save_json_path=None
         ):
         """ Uploads a JSON file containing necessary input for running a PyStan2 sampling script.
         Args:
@@ -30,7 +31,7 @@ class PyStanSSH(BaseConnection):
                 Default is None
             init (Dict or List[Dict]): Initial condition dictionary or a list of initial condition
                 dictionaries for each chain.  Default is None.
-            close_connection (bool): Close connection once complete.  Default is True.
+            close_connection (bool): Close connection once complete.  Default is False.
             save_json_path (str or pathlib.Path): If provided, the dictionary is dumped in the
                 given path.  If no file name is given, then fname is used. Default is None. 
         
@@ -66,14 +67,12 @@ class PyStanSSH(BaseConnection):
         if save_json_path is not None:
             save_json_path = self._pathtype_check(save_json_path)
 
-            if len(save_json_path.suffix):
-                with open(save_json_path, 'w') as f:
-                    json.dump(stan_dict, f, indent=4)
-            
             # Handle no file name in given path:
-            else:
-                with open(save_json_path / (fname.split('.')[0] + '.json', 'w')) as f:
-                    json.dump(stan_dict, f, indent=4)
+            if not len(save_json_path.suffix):
+                save_json_path = save_json_path / (fname.split('.')[0] + '.json')
+
+            # Encode the same way as the uploaded copy:
+            self.save_json(stan_dict, save_json_path)
 
         # Upload Stan code file if given:
         if stan_code_path is not None:
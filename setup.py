@@ -16,7 +16,8 @@ setup(
     license='GPL V3',
     packages=find_packages(exclude=('tests')),
     zip_safe=False,
-    install_requires=['paramiko', 'numpy'],
+    install_requires=['paramiko>=3.3', 'numpy'],
+    extras_require={'orjson': ['orjson']},
     long_description=readme,
     long_description_content_type="text/markdown",
     include_package_data=True
@@ -0,0 +1,287 @@
+""" Regression tests for BaseConnection SFTP transfers, run against an in-process
+    paramiko SFTP server over a socket pair.
+"""
+from io import StringIO
+import json
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+import paramiko
+
+from pystanssh.base import BaseConnection
+
+
+class StubHandle(paramiko.SFTPHandle):
+    """ SFTP handle refusing writes to files named 'readonly'.
+    """
+    def write(self, offset, data):
+        if os.path.basename(self.filename) == 'readonly':
+            return paramiko.SFTP_PERMISSION_DENIED
+
+        return super().write(offset, data)
+
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+
+
+class StubSFTPServer(paramiko.SFTPServerInterface):
+    """ Minimal SFTP server backed by the local filesystem.
+    """
+    def open(self, path, flags, attr):
+        try:
+            fd = os.open(path, flags, 0o644)
+
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+        mode = 'wb' if flags & os.O_WRONLY else 'rb'
+        handle = StubHandle(flags)
+        handle.filename = path
+        handle.readfile = handle.writefile = os.fdopen(fd, mode)
+
+        return handle
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(path))
+
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    lstat = stat
+
+
+class StubServer(paramiko.ServerInterface):
+    """ SSH server accepting any password and session channel, running exec requests
+        as local shell commands.
+    """
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+    def check_channel_exec_request(self, channel, command):
+        threading.Thread(target=self._run, args=(channel, command), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _run(channel, command):
+        process = subprocess.Popen(
+            command, shell=True,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+
+        # Feed channel input to stdin until the client shuts down writing:
+        def _feed():
+            try:
+                for data in iter(lambda: channel.recv(65536), b''):
+                    process.stdin.write(data)
+
+                process.stdin.close()
+
+            except OSError:
+                pass
+
+        feeder = threading.Thread(target=_feed, daemon=True)
+        feeder.start()
+        out, err = process.stdout.read(), process.stderr.read()
+        status = process.wait()
+        process.stdout.close()
+        process.stderr.close()
+        channel.sendall(out)
+        channel.sendall_stderr(err)
+        channel.send_exit_status(status)
+        channel.close()
+
+
+class StubClient(object):
+    """ Stand-in for paramiko.SSHClient wrapping an already connected transport.
+    """
+    def __init__(self, transport):
+        self.transport = transport
+
+    def get_transport(self):
+        return self.transport
+
+
+class TestPipelinedTransfers(unittest.TestCase):
+    """ Round trips through the pipelined SFTP read/write paths.
+    """
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        keypath = os.path.join(self.tmp, 'key')
+        paramiko.RSAKey.generate(2048).write_private_key_file(keypath)
+
+        # Server and client transports over a connected socket pair:
+        server_sock, client_sock = socket.socketpair()
+        self.server = paramiko.Transport(server_sock)
+        self.server.add_server_key(paramiko.RSAKey.generate(2048))
+        self.server.set_subsystem_handler('sftp', paramiko.SFTPServer, StubSFTPServer)
+        self.server.start_server(event=threading.Event(), server=StubServer())
+
+        self.client = paramiko.Transport(client_sock)
+        self.client.connect(username='user', password='password')
+
+        # Small request size so a moderate file overflows the in-flight window:
+        self.conn = BaseConnection('localhost', 'user', keypath, request_size=4096)
+        self.conn.stfp_tunnel = paramiko.SFTPClient.from_transport(self.client)
+        self.conn.client = StubClient(self.client)
+
+    def tearDown(self):
+        self.conn.stfp_tunnel.close()
+        self.client.close()
+        self.server.close()
+        shutil.rmtree(self.tmp)
+
+    def test_send_larger_than_window(self):
+        local_path = os.path.join(self.tmp, 'local.bin')
+        host_path = os.path.join(self.tmp, 'host.bin')
+        max_inflight = 8
+        data = os.urandom(self.conn.request_size * max_inflight * 3 + 123)
+        with open(local_path, 'wb') as f:
+            f.write(data)
+
+        output = self.conn.send_pipelined(
+            local_path, host_path, max_inflight=max_inflight, verify=True
+        )
+        self.assertEqual(output.st_size, len(data))
+        with open(host_path, 'rb') as f:
+            self.assertEqual(f.read(), data)
+
+        # Read it back through the pipelined get path:
+        self.assertEqual(self.conn.get_fileobject(host_path).read(), data)
+
+    def test_send_multibyte_stringio(self):
+        host_path = os.path.join(self.tmp, 'host.txt')
+        text = 'héllo wörld ✓\n' * 5000
+        output = self.conn.send_fileobject(StringIO(text), host_path, verify=True)
+        self.assertEqual(output.st_size, len(text.encode('utf-8')))
+        with open(host_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), text)
+
+    def test_write_error_raises(self):
+        host_path = os.path.join(self.tmp, 'readonly')
+        with self.assertRaises(IOError):
+            self.conn.send_fileobject(StringIO('x' * 100000), host_path)
+
+    def test_send_json_keeps_nonfinite_floats(self):
+        host_path = os.path.join(self.tmp, 'host.json')
+        local_path = os.path.join(self.tmp, 'local.json')
+        data = {'x': [float('nan'), 1.0, float('inf')], 'y': [1, 2]}
+        self.conn.send_json(data, host_path)
+        self.conn.save_json(data, local_path)
+
+        with open(host_path, 'rb') as f:
+            uploaded = f.read()
+
+        self.assertIn(b'NaN', uploaded)
+        self.assertIn(b'Infinity', uploaded)
+        with open(local_path, 'rb') as f:
+            self.assertEqual(f.read(), uploaded)
+
+    def test_send_json_none_and_ndarray(self):
+        host_path = os.path.join(self.tmp, 'host.json')
+        data = {'a': None, 'b': np.arange(3), 'c': 'null', 'd': np.float32(0.5)}
+        self.conn.send_json(data, host_path)
+        with open(host_path, encoding='utf-8') as f:
+            self.assertEqual(
+                json.load(f), {'a': None, 'b': [0, 1, 2], 'c': 'null', 'd': 0.5}
+            )
+
+    def test_send_json_big_int(self):
+        host_path = os.path.join(self.tmp, 'host.json')
+        data = {'n': 2 ** 70, 'x': np.array([1.5, float('nan')])}
+        self.conn.send_json(data, host_path)
+        with open(host_path, encoding='utf-8') as f:
+            loaded = json.load(f)
+
+        self.assertEqual(loaded['n'], 2 ** 70)
+        self.assertEqual(loaded['x'][0], 1.5)
+        self.assertTrue(np.isnan(loaded['x'][1]))
+
+    def _write_files(self, names):
+        paths = []
+        for name in names:
+            path = os.path.join(self.tmp, name)
+            with open(path, 'wb') as f:
+                f.write(os.urandom(10000) + name.encode('utf-8'))
+
+            paths.append(path)
+
+        return paths
+
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_upload_download_files(self):
+        local_paths = self._write_files(['a.bin', 'b.bin', 'c.bin'])
+        host_dir = os.path.join(self.tmp, 'host')
+        back_dir = os.path.join(self.tmp, 'back')
+        os.mkdir(host_dir)
+        os.mkdir(back_dir)
+
+        # Directory host paths get the local file name; a named path is kept:
+        renamed = os.path.join(host_dir, 'renamed.bin')
+        outputs = self.conn.upload_files(
+            [(local_paths[0], host_dir), (local_paths[1], host_dir),
+             (local_paths[2], renamed)],
+            max_workers=2, verify=True
+        )
+        self.assertEqual(
+            [output.st_size for output in outputs],
+            [os.path.getsize(path) for path in local_paths]
+        )
+        self.assertEqual(sorted(os.listdir(host_dir)), ['a.bin', 'b.bin', 'renamed.bin'])
+        self.assertEqual(self._read(renamed), self._read(local_paths[2]))
+
+        host_paths = [os.path.join(host_dir, name) for name in ('a.bin', 'b.bin')]
+        self.conn.download_files(
+            [(host_paths[0], back_dir), (host_paths[1], os.path.join(back_dir, 'x.bin'))],
+            max_workers=2, compress=False
+        )
+        self.assertEqual(
+            self._read(os.path.join(back_dir, 'a.bin')), self._read(local_paths[0])
+        )
+        self.assertEqual(
+            self._read(os.path.join(back_dir, 'x.bin')), self._read(local_paths[1])
+        )
+
+    def test_upload_files_tar(self):
+        local_paths = self._write_files(['a.txt', 'b.txt'])
+        host_dir = os.path.join(self.tmp, 'host dir')
+        os.mkdir(host_dir)
+
+        host_paths = self.conn.upload_files_tar(local_paths, host_dir)
+        for host_path, local_path in zip(host_paths, local_paths):
+            self.assertEqual(self._read(host_path), self._read(local_path))
+
+    def test_upload_files_tar_missing_dir_raises(self):
+        local_paths = self._write_files(['a.txt'])
+        with self.assertRaises(IOError):
+            self.conn.upload_files_tar(local_paths, os.path.join(self.tmp, 'missing'))
+
+
+class TestQuoteHostPath(unittest.TestCase):
+    """ Shell quoting of host paths in remote commands.
+    """
+    def test_home_expansion_kept(self):
+        self.assertEqual(BaseConnection._quote_host_path('~'), '~')
+        self.assertEqual(BaseConnection._quote_host_path('~/my runs'), "~/'my runs'")
+
+    def test_special_characters_quoted(self):
+        self.assertEqual(BaseConnection._quote_host_path('/tmp/a b;c'), "'/tmp/a b;c'")
+
+
+if __name__ == '__main__':
+    unittest.main()
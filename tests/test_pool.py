@@ -0,0 +1,102 @@
+""" Unit tests for SSHConnectionPool using stub clients.
+"""
+import time
+import unittest
+
+from pystanssh.pool import SSHConnectionPool
+
+
+class StubTransport(object):
+    """ Transport stub reporting a fixed liveness.
+    """
+    def __init__(self, active=True):
+        self.active = active
+
+    def is_active(self):
+        return self.active
+
+    def send_ignore(self):
+        pass
+
+
+class StubClient(object):
+    """ paramiko.SSHClient stub recording whether it was closed.
+    """
+    def __init__(self, active=True):
+        self.transport = StubTransport(active)
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+
+
+class TestSSHConnectionPool(unittest.TestCase):
+    """ Reuse, limits and eviction of pooled clients.
+    """
+    def setUp(self):
+        self.pool = SSHConnectionPool(max_connections=2, idle_timeout=0.05)
+
+    def tearDown(self):
+        self.pool.clear()
+
+    def test_acquire_returns_released_client(self):
+        client = StubClient()
+        self.pool.release('key', client)
+        self.assertIs(self.pool.acquire('key'), client)
+        self.assertIsNone(self.pool.acquire('key'))
+        self.assertIsNone(self.pool.acquire('other'))
+        self.assertFalse(client.closed)
+
+    def test_max_connections(self):
+        clients = [StubClient() for _ in range(3)]
+        for client in clients:
+            self.pool.release('key', client)
+
+        self.assertEqual([client.closed for client in clients], [False, False, True])
+
+    def test_dead_client_closed_on_release(self):
+        client = StubClient(active=False)
+        self.pool.release('key', client)
+        self.assertTrue(client.closed)
+        self.assertIsNone(self.pool.acquire('key'))
+
+    def test_dead_client_skipped_on_acquire(self):
+        client = StubClient()
+        self.pool.release('key', client)
+        client.transport.active = False
+        self.assertIsNone(self.pool.acquire('key'))
+        self.assertTrue(client.closed)
+
+    def test_idle_eviction_without_pool_calls(self):
+        client = StubClient()
+        self.pool.release('key', client)
+
+        # No further acquire/release; the eviction timer alone must close it:
+        deadline = time.monotonic() + 2
+        while not client.closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertTrue(client.closed)
+        self.assertIsNone(self.pool.acquire('key'))
+
+    def test_clear_closes_idle_clients(self):
+        clients = [StubClient(), StubClient()]
+        self.pool.release('a', clients[0])
+        self.pool.release('b', clients[1])
+        self.pool.clear()
+        self.assertTrue(all(client.closed for client in clients))
+        self.assertIsNone(self.pool._evictor)
+
+    def test_reset_after_fork_drops_without_closing(self):
+        client = StubClient()
+        self.pool.release('key', client)
+        self.pool._reset_after_fork()
+        self.assertIsNone(self.pool.acquire('key'))
+        self.assertFalse(client.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()